@@ -1,6 +1,9 @@
-from fastapi import APIRouter
+import orjson
+from fastapi import APIRouter, Response
 router = APIRouter()
 
+_HEALTH = orjson.dumps({"status": "healthy", "service": "budget-optimization-agent"})
+
 @router.get("/health")
 async def budget_optimization_health():
-    return {"status": "healthy", "service": "budget-optimization-agent"}
+    return Response(_HEALTH, media_type="application/json")
@@ -0,0 +1,65 @@
+"""
+Numba kernels for the Data Acquisition Agent image pipeline
+Hand-specialized versions of the fixed-weight filters used in preprocessing
+"""
+
+import numpy as np
+from numba import njit
+
+
+@njit("void(uint8[:,::1], uint8[:,::1])", cache=True, fastmath=True)
+def sharpen3x3(src, dst):
+    """
+    Apply the [[-1,-1,-1], [-1,9,-1], [-1,-1,-1]] sharpening kernel to src,
+    writing the saturated result into dst. Borders are reflected
+    (BORDER_REFLECT_101) to match cv2.filter2D's default; a dimension of
+    size 1 reflects onto itself.
+    """
+    h, w = src.shape
+    for i in range(h):
+        up = i - 1 if i > 0 else min(1, h - 1)
+        down = i + 1 if i < h - 1 else max(h - 2, 0)
+        for j in range(w):
+            left = j - 1 if j > 0 else min(1, w - 1)
+            right = j + 1 if j < w - 1 else max(w - 2, 0)
+            v = (
+                9 * np.int32(src[i, j])
+                - np.int32(src[up, left]) - np.int32(src[up, j]) - np.int32(src[up, right])
+                - np.int32(src[i, left]) - np.int32(src[i, right])
+                - np.int32(src[down, left]) - np.int32(src[down, j]) - np.int32(src[down, right])
+            )
+            dst[i, j] = min(max(v, 0), 255)
+
+
+@njit("UniTuple(float64, 2)(uint8[:,::1])", cache=True, fastmath=True)
+def quality_stats(img):
+    """
+    Single-pass focus/brightness statistics for a grayscale image.
+    Returns (laplacian_variance, mean_brightness), equivalent to
+    cv2.Laplacian(img, cv2.CV_64F).var() and np.mean(img) without any
+    full-size intermediate array.
+    """
+    h, w = img.shape
+    # Integer accumulators: a 3x3 Laplacian of uint8 input fits in int32 and
+    # the sums stay exact in int64, so no float intermediate is needed per pixel
+    sum_pix = np.int64(0)
+    sum_lap = np.int64(0)
+    sum_lap_sq = np.int64(0)
+    for i in range(h):
+        up = i - 1 if i > 0 else min(1, h - 1)
+        down = i + 1 if i < h - 1 else max(h - 2, 0)
+        for j in range(w):
+            left = j - 1 if j > 0 else min(1, w - 1)
+            right = j + 1 if j < w - 1 else max(w - 2, 0)
+            center = np.int32(img[i, j])
+            lap = (
+                4 * center
+                - np.int32(img[up, j]) - np.int32(img[down, j])
+                - np.int32(img[i, left]) - np.int32(img[i, right])
+            )
+            sum_pix += center
+            sum_lap += lap
+            sum_lap_sq += lap * lap
+    n = h * w
+    mean_lap = sum_lap / n
+    return sum_lap_sq / n - mean_lap * mean_lap, sum_pix / n
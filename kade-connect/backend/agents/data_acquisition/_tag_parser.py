@@ -0,0 +1,42 @@
+"""
+Regex fast path for simple price tags ("Anchor Milk 450g Rs. 890")
+Kept free of Vision/OpenAI/Numba imports so it is cheap to import and test
+"""
+
+import re
+from typing import Optional, Tuple
+
+# A known brand plus an explicit LKR price is parsed without calling the LLM
+_KNOWN_BRAND_RE = re.compile(
+    r'\b(Anchor|Maliban|Munchee|Kotmale|Pelwatte|CBL|Nestle|Elephant House)\b',
+    re.IGNORECASE
+)
+# Either comma-grouped ("1,150") or plain ("1150") digits, never a truncated prefix
+_TAG_PRICE_RE = re.compile(
+    r'\b(?:Rs\.?|LKR)\s*((?:\d{1,3}(?:,\d{3})+|\d+)(?:\.\d{1,2})?)(?![\d,])',
+    re.IGNORECASE
+)
+
+
+def parse_price_tag(ocr_text: str) -> Optional[Tuple[str, str, float]]:
+    """
+    Extract (product_name, brand, price) from a trivially structured tag
+    Returns None unless both a known brand and an LKR price are found
+    """
+    brand_match = _KNOWN_BRAND_RE.search(ocr_text)
+    price_match = _TAG_PRICE_RE.search(ocr_text)
+    if not brand_match or not price_match:
+        return None
+    
+    # Use the OCR line carrying the brand, minus the price, as the name
+    line_start = ocr_text.rfind('\n', 0, brand_match.start()) + 1
+    line_end = ocr_text.find('\n', brand_match.end())
+    if line_end == -1:
+        line_end = len(ocr_text)
+    if line_start <= price_match.start() and price_match.end() <= line_end:
+        line = ocr_text[line_start:price_match.start()] + ocr_text[price_match.end():line_end]
+    else:
+        line = ocr_text[line_start:line_end]
+    product_name = ' '.join(line.split()) or brand_match.group(1)
+    
+    return product_name, brand_match.group(1), float(price_match.group(1).replace(',', ''))
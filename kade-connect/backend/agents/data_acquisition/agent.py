@@ -1,24 +1,89 @@
 """
 Data Acquisition Agent - Processes scout-submitted images to extract product data
-Uses Google Vision API for OCR and LangChain for intelligent text parsing
+Uses Google Vision API for OCR and OpenAI JSON-mode chat completions for intelligent text parsing
 """
 
 from typing import Optional, List, Dict, Any, Tuple
 from pydantic import BaseModel, Field
-import cv2
 import numpy as np
+import aiofiles
 from google.cloud import vision
-from langchain.llms import OpenAI
-from langchain.prompts import PromptTemplate
-from langchain.schema import BaseOutputParser
+from google.cloud.vision_v1.services.image_annotator.transports import ImageAnnotatorGrpcTransport
+from openai import AsyncOpenAI
 import json
 import re
+import os
+import time
+import asyncio
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
 import logging
 from backend.shared.config import settings
+from backend.agents.data_acquisition._preprocess import cpu_stage, warm_kernels
+from backend.agents.data_acquisition._tag_parser import parse_price_tag
 
 logger = logging.getLogger(__name__)
 
+# Parsing prompt for Sri Lankan context
+PROMPT_TEMPLATE = """
+You are an expert at extracting product information from Sri Lankan shop price tags and product labels.
+
+OCR Text from image:
+{ocr_text}
+
+Extract the following information and return as JSON:
+{{
+    "product_name": "Product name in English (translate if in Sinhala/Tamil)",
+    "brand": "Brand name if visible",
+    "price": "Price in LKR (numbers only, no currency symbols)",
+    "unit": "Unit of measurement (kg, g, ml, l, pieces, etc)",
+    "shop_name": "Shop or store name if mentioned",
+    "category": "Product category (groceries, dairy, beverages, etc)",
+    "confidence_score": "Your confidence in the extraction (0.0 to 1.0)"
+}}
+
+Common Sri Lankan brands: Anchor, Maliban, Munchee, Kotmale, Pelwatte, CBL, etc.
+Common Sinhala/Tamil words:
+- කිරි/பால் = Milk
+- පාන්/ब्रेड = Bread  
+- බත්/चावल = Rice
+- සීනි/चीनी = Sugar
+- තේ/चाय = Tea
+
+If price is not clearly visible, set price to null.
+If product name is unclear, make your best guess based on context.
+"""
+
+# Fallback patterns for non-JSON LLM replies
+_NAME_RE = re.compile(r'product[_ ]name[:\s]+([^\n]+)', re.IGNORECASE)
+_BRAND_RE = re.compile(r'brand[:\s]+([^\n]+)', re.IGNORECASE)
+_PRICE_RE = re.compile(r'price[:\s]+(\d+\.?\d*)', re.IGNORECASE)
+_UNIT_RE = re.compile(r'unit[:\s]+([^\n]+)', re.IGNORECASE)
+_SHOP_RE = re.compile(r'shop[_ ]name[:\s]+([^\n]+)', re.IGNORECASE)
+
+# Google Vision accepts at most 16 images per batch_annotate_images call
+VISION_BATCH_SIZE = 16
+
+# gRPC channel options for the shared Vision client: allow many concurrent
+# streams on one connection and keep it alive between bursts of uploads
+VISION_CHANNEL_OPTIONS = [
+    ("grpc.max_send_message_length", -1),
+    ("grpc.max_receive_message_length", -1),
+    ("grpc.max_concurrent_streams", 100),
+    ("grpc.keepalive_time_ms", 30000),
+]
+
+# Concurrent OpenAI requests, shared by all callers to stay within rate limits
+LLM_CONCURRENCY = 5
+_llm_sem = asyncio.Semaphore(LLM_CONCURRENCY)
+
+# Worker processes for the CPU-bound OpenCV/Numba stage, kept off the event loop.
+# Created and shut down by the app lifespan (start_cpu_pool/shutdown_cpu_pool)
+_proc_pool: Optional[ProcessPoolExecutor] = None
+
 
 class ProductData(BaseModel):
     """Structured output from image processing"""
@@ -30,7 +95,7 @@ class ProductData(BaseModel):
     category: Optional[str] = Field(description="Product category", default=None)
     confidence_score: float = Field(description="Confidence in extraction (0-1)", default=0.0)
     raw_text: str = Field(description="Raw OCR text", default="")
-    processing_timestamp: datetime = Field(default_factory=datetime.now)
+    processing_timestamp: Optional[datetime] = None  # Set just before the DB save
 
 
 class ProcessingResult(BaseModel):
@@ -42,8 +107,8 @@ class ProcessingResult(BaseModel):
     image_quality_score: Optional[float] = None
 
 
-class ProductDataParser(BaseOutputParser):
-    """Custom parser for LangChain output"""
+class ProductDataParser:
+    """Parser for LLM output, with a regex fallback for non-JSON replies"""
     
     def parse(self, text: str) -> ProductData:
         """Parse LLM output into ProductData"""
@@ -57,27 +122,27 @@ class ProductDataParser(BaseOutputParser):
             product_data = {}
             
             # Extract product name
-            name_match = re.search(r'product[_ ]name[:\s]+([^\n]+)', text, re.IGNORECASE)
+            name_match = _NAME_RE.search(text)
             if name_match:
                 product_data['product_name'] = name_match.group(1).strip()
             
             # Extract brand
-            brand_match = re.search(r'brand[:\s]+([^\n]+)', text, re.IGNORECASE)
+            brand_match = _BRAND_RE.search(text)
             if brand_match:
                 product_data['brand'] = brand_match.group(1).strip()
             
             # Extract price
-            price_match = re.search(r'price[:\s]+(\d+\.?\d*)', text, re.IGNORECASE)
+            price_match = _PRICE_RE.search(text)
             if price_match:
                 product_data['price'] = float(price_match.group(1))
             
             # Extract unit
-            unit_match = re.search(r'unit[:\s]+([^\n]+)', text, re.IGNORECASE)
+            unit_match = _UNIT_RE.search(text)
             if unit_match:
                 product_data['unit'] = unit_match.group(1).strip()
             
             # Extract shop name
-            shop_match = re.search(r'shop[_ ]name[:\s]+([^\n]+)', text, re.IGNORECASE)
+            shop_match = _SHOP_RE.search(text)
             if shop_match:
                 product_data['shop_name'] = shop_match.group(1).strip()
             
@@ -101,121 +166,41 @@ class DataAcquisitionAgent:
     """
     
     def __init__(self):
-        # Initialize Google Vision client
-        self.vision_client = vision.ImageAnnotatorClient()
-        
-        # Initialize LangChain LLM
-        self.llm = OpenAI(
-            temperature=0,
-            openai_api_key=settings.OPENAI_API_KEY,
-            model_name="gpt-3.5-turbo-instruct"
-        )
-        
-        # Create parsing prompt for Sri Lankan context
-        self.parse_prompt = PromptTemplate(
-            input_variables=["ocr_text"],
-            template="""
-            You are an expert at extracting product information from Sri Lankan shop price tags and product labels.
-            
-            OCR Text from image:
-            {ocr_text}
-            
-            Extract the following information and return as JSON:
-            {{
-                "product_name": "Product name in English (translate if in Sinhala/Tamil)",
-                "brand": "Brand name if visible",
-                "price": "Price in LKR (numbers only, no currency symbols)",
-                "unit": "Unit of measurement (kg, g, ml, l, pieces, etc)",
-                "shop_name": "Shop or store name if mentioned",
-                "category": "Product category (groceries, dairy, beverages, etc)",
-                "confidence_score": "Your confidence in the extraction (0.0 to 1.0)"
-            }}
-            
-            Common Sri Lankan brands: Anchor, Maliban, Munchee, Kotmale, Pelwatte, CBL, etc.
-            Common Sinhala/Tamil words:
-            - කිරි/பால் = Milk
-            - පාන්/ब्रेड = Bread  
-            - බත්/चावल = Rice
-            - සීනි/चीनी = Sugar
-            - තේ/चाय = Tea
-            
-            If price is not clearly visible, set price to null.
-            If product name is unclear, make your best guess based on context.
-            """
-        )
+        # Shared async OpenAI client (HTTP keep-alive across requests)
+        self.async_openai = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
         
         self.parser = ProductDataParser()
+        
+        self._vision_client: Optional[vision.ImageAnnotatorClient] = None
+        self._vision_client_lock = threading.Lock()
     
-    def _preprocess_image(self, image_path: str) -> np.ndarray:
-        """
-        Preprocess image for better OCR results
-        """
-        try:
-            # Read image
-            image = cv2.imread(image_path)
-            if image is None:
-                raise ValueError(f"Could not read image from {image_path}")
-            
-            # Convert to grayscale
-            gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-            
-            # Apply CLAHE (Contrast Limited Adaptive Histogram Equalization)
-            clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8,8))
-            enhanced = clahe.apply(gray)
-            
-            # Noise reduction
-            denoised = cv2.fastNlMeansDenoising(enhanced)
-            
-            # Sharpening
-            kernel = np.array([[-1,-1,-1], [-1,9,-1], [-1,-1,-1]])
-            sharpened = cv2.filter2D(denoised, -1, kernel)
-            
-            return sharpened
-            
-        except Exception as e:
-            logger.error(f"Error preprocessing image: {e}")
-            # Return original image if preprocessing fails
-            return cv2.imread(image_path)
-    
-    def _assess_image_quality(self, image: np.ndarray) -> float:
+    @property
+    def vision_client(self) -> vision.ImageAnnotatorClient:
         """
-        Assess image quality for OCR suitability
-        Returns score from 0.0 to 1.0
+        Google Vision client, created on first use and reused for all requests
+        First use happens in executor threads, so creation is guarded by a lock
         """
-        try:
-            # Calculate Laplacian variance (focus measure)
-            laplacian_var = cv2.Laplacian(image, cv2.CV_64F).var()
-            
-            # Normalize to 0-1 scale (empirically determined thresholds)
-            focus_score = min(laplacian_var / 500, 1.0)
-            
-            # Calculate brightness score
-            mean_brightness = np.mean(image)
-            brightness_score = 1.0 - abs(mean_brightness - 127) / 127
-            
-            # Combined quality score
-            quality_score = (focus_score * 0.7) + (brightness_score * 0.3)
-            
-            return min(quality_score, 1.0)
-            
-        except Exception as e:
-            logger.error(f"Error assessing image quality: {e}")
-            return 0.5  # Return neutral score if assessment fails
+        if self._vision_client is None:
+            with self._vision_client_lock:
+                if self._vision_client is None:
+                    channel = ImageAnnotatorGrpcTransport.create_channel(
+                        "vision.googleapis.com:443",
+                        options=VISION_CHANNEL_OPTIONS
+                    )
+                    self._vision_client = vision.ImageAnnotatorClient(
+                        transport=ImageAnnotatorGrpcTransport(channel=channel)
+                    )
+        return self._vision_client
     
-    def _extract_text_with_vision_api(self, image_path: str) -> str:
+    def _extract_text_with_vision_api(self, content: bytes) -> str:
         """
-        Extract text from image using Google Vision API
+        Extract text from encoded image bytes using Google Vision API
         """
         try:
-            with open(image_path, 'rb') as image_file:
-                content = image_file.read()
-            
             image = vision.Image(content=content)
             
             # Configure text detection
-            image_context = vision.ImageContext(
-                language_hints=['en', 'si', 'ta']  # English, Sinhala, Tamil
-            )
+            image_context = self._vision_image_context()
             
             response = self.vision_client.text_detection(
                 image=image,
@@ -236,9 +221,72 @@ class DataAcquisitionAgent:
             logger.error(f"Error with Vision API: {e}")
             return ""
     
-    def _parse_with_llm(self, ocr_text: str) -> ProductData:
+    @staticmethod
+    def _vision_image_context() -> vision.ImageContext:
+        """Vision context hinting the languages found on Sri Lankan labels"""
+        return vision.ImageContext(
+            language_hints=['en', 'si', 'ta']  # English, Sinhala, Tamil
+        )
+    
+    def _extract_texts_with_vision_api(self, contents: List[bytes]) -> List[str]:
         """
-        Parse OCR text using LangChain and LLM
+        Extract text from several encoded images with batched Vision API calls
+        Returns one OCR string per input, empty on per-image errors
+        """
+        image_context = self._vision_image_context()
+        feature = vision.Feature(type_=vision.Feature.Type.TEXT_DETECTION)
+        texts = []
+        
+        for start in range(0, len(contents), VISION_BATCH_SIZE):
+            chunk = contents[start:start + VISION_BATCH_SIZE]
+            try:
+                requests = [
+                    vision.AnnotateImageRequest(
+                        image=vision.Image(content=content),
+                        features=[feature],
+                        image_context=image_context
+                    )
+                    for content in chunk
+                ]
+                response = self.vision_client.batch_annotate_images(requests=requests)
+                
+                for image_response in response.responses:
+                    if image_response.error.message:
+                        logger.error(f"Vision API error: {image_response.error.message}")
+                        texts.append("")
+                    elif image_response.text_annotations:
+                        texts.append(image_response.text_annotations[0].description)
+                    else:
+                        texts.append("")
+                        
+            except Exception as e:
+                logger.error(f"Error with Vision API batch: {e}")
+                texts.extend([""] * len(chunk))
+        
+        return texts
+    
+    @staticmethod
+    def _parse_with_regex(ocr_text: str) -> Optional[ProductData]:
+        """
+        Parse trivially structured tags without the LLM
+        Returns None unless both a known brand and an LKR price are found
+        """
+        parsed = parse_price_tag(ocr_text)
+        if parsed is None:
+            return None
+        
+        product_name, brand, price = parsed
+        return ProductData(
+            product_name=product_name,
+            brand=brand,
+            price=price,
+            raw_text=ocr_text,
+            confidence_score=0.85
+        )
+    
+    async def _parse_with_llm(self, ocr_text: str) -> ProductData:
+        """
+        Parse OCR text using an OpenAI JSON-mode chat completion
         """
         try:
             if not ocr_text.strip():
@@ -248,11 +296,23 @@ class DataAcquisitionAgent:
                     confidence_score=0.0
                 )
             
-            # Create chain with prompt and parser
-            chain = self.parse_prompt | self.llm | self.parser
+            # Skip the LLM round-trip when the tag is unambiguous
+            fast_result = self._parse_with_regex(ocr_text)
+            if fast_result is not None:
+                return fast_result
+            
+            async with _llm_sem:
+                response = await self.async_openai.chat.completions.create(
+                    model="gpt-4o-mini",
+                    messages=[{
+                        "role": "user",
+                        "content": PROMPT_TEMPLATE.format(ocr_text=ocr_text)
+                    }],
+                    response_format={"type": "json_object"},
+                    temperature=0
+                )
             
-            # Run the chain
-            result = chain.invoke({"ocr_text": ocr_text})
+            result = self.parser.parse(response.choices[0].message.content)
             result.raw_text = ocr_text
             
             return result
@@ -282,52 +342,126 @@ class DataAcquisitionAgent:
         Returns:
             ProcessingResult with extracted data or error information
         """
-        start_time = datetime.now()
+        start_ns = time.perf_counter_ns()
         
         try:
             logger.info(f"Processing image: {image_path}")
             
-            # Preprocess image
-            processed_image = self._preprocess_image(image_path)
+            # Read the upload once and decode from memory
+            async with aiofiles.open(image_path, 'rb') as image_file:
+                content = await image_file.read()
+            
+            loop = asyncio.get_running_loop()
             
-            # Assess image quality
-            quality_score = self._assess_image_quality(processed_image)
+            # Decode, preprocess and assess quality in a worker process
+            vision_content, quality_score = await _run_cpu_stage(content)
             logger.info(f"Image quality score: {quality_score}")
             
-            # Extract text using Vision API
-            ocr_text = self._extract_text_with_vision_api(image_path)
+            # Extract text using Vision API (blocking I/O, default thread pool)
+            ocr_text = await loop.run_in_executor(
+                None, self._extract_text_with_vision_api, vision_content
+            )
             logger.info(f"OCR extracted {len(ocr_text)} characters")
             
             # Parse with LLM
-            product_data = self._parse_with_llm(ocr_text)
-            
-            # Adjust confidence based on image quality
-            if product_data.confidence_score > 0:
-                product_data.confidence_score *= quality_score
+            product_data = await self._parse_with_llm(ocr_text)
             
-            # Add GPS coordinates if provided
-            if gps_coords and hasattr(product_data, '__dict__'):
-                product_data.__dict__['gps_latitude'] = gps_coords[0]
-                product_data.__dict__['gps_longitude'] = gps_coords[1]
-            
-            processing_time = (datetime.now() - start_time).total_seconds() * 1000
-            
-            return ProcessingResult(
-                success=True,
-                product_data=product_data,
-                processing_time_ms=int(processing_time),
-                image_quality_score=quality_score
-            )
+            return self._build_result(product_data, quality_score, start_ns, gps_coords)
             
         except Exception as e:
             logger.error(f"Error processing image: {e}")
-            processing_time = (datetime.now() - start_time).total_seconds() * 1000
+            return self._build_error_result(e, start_ns)
+    
+    async def process_images(self, image_paths: List[str]) -> List[ProcessingResult]:
+        """
+        Process several scout images together
+        Preprocessing runs concurrently and OCR is done with batched Vision API calls
+        
+        Args:
+            image_paths: Paths to the uploaded images
             
-            return ProcessingResult(
-                success=False,
-                error_message=str(e),
-                processing_time_ms=int(processing_time)
+        Returns:
+            One ProcessingResult per path, in the same order
+        """
+        start_ns = time.perf_counter_ns()
+        loop = asyncio.get_running_loop()
+        results: List[Optional[ProcessingResult]] = [None] * len(image_paths)
+        
+        async def read_and_score(image_path: str) -> Tuple[bytes, float]:
+            async with aiofiles.open(image_path, 'rb') as image_file:
+                content = await image_file.read()
+            return await _run_cpu_stage(content)
+        
+        stages = await asyncio.gather(
+            *[read_and_score(path) for path in image_paths],
+            return_exceptions=True
+        )
+        
+        ok_indices = []
+        for i, stage in enumerate(stages):
+            if isinstance(stage, Exception):
+                logger.error(f"Error processing image {image_paths[i]}: {stage}")
+                results[i] = self._build_error_result(stage, start_ns)
+            else:
+                ok_indices.append(i)
+        
+        if ok_indices:
+            # One Vision round-trip for the whole batch
+            ocr_texts = await loop.run_in_executor(
+                None,
+                self._extract_texts_with_vision_api,
+                [stages[i][0] for i in ok_indices]
             )
+            
+            # Fan the OCR text out to LLM calls, bounded by _llm_sem
+            product_datas = await asyncio.gather(
+                *[self._parse_with_llm(text) for text in ocr_texts]
+            )
+            
+            for i, product_data in zip(ok_indices, product_datas):
+                results[i] = self._build_result(product_data, stages[i][1], start_ns)
+        
+        return results
+    
+    def _build_result(
+        self,
+        product_data: ProductData,
+        quality_score: float,
+        start_ns: int,
+        gps_coords: Optional[Tuple[float, float]] = None
+    ) -> ProcessingResult:
+        """
+        Build a successful ProcessingResult from parsed product data
+        """
+        # Adjust confidence based on image quality
+        if product_data.confidence_score > 0:
+            product_data.confidence_score *= quality_score
+        
+        # Add GPS coordinates if provided
+        if gps_coords and hasattr(product_data, '__dict__'):
+            product_data.__dict__['gps_latitude'] = gps_coords[0]
+            product_data.__dict__['gps_longitude'] = gps_coords[1]
+        
+        processing_time = (time.perf_counter_ns() - start_ns) // 1_000_000
+        
+        return ProcessingResult(
+            success=True,
+            product_data=product_data,
+            processing_time_ms=processing_time,
+            image_quality_score=quality_score
+        )
+    
+    def _build_error_result(self, error: Exception, start_ns: int) -> ProcessingResult:
+        """
+        Build a failed ProcessingResult
+        """
+        processing_time = (time.perf_counter_ns() - start_ns) // 1_000_000
+        
+        return ProcessingResult(
+            success=False,
+            error_message=str(error),
+            processing_time_ms=processing_time
+        )
     
     def validate_product_data(self, product_data: ProductData) -> bool:
         """
@@ -347,3 +481,72 @@ class DataAcquisitionAgent:
                 return False
         
         return True
+    
+    def validate_batch(
+        self,
+        product_names: List[str],
+        confidences: np.ndarray,
+        prices: np.ndarray
+    ) -> np.ndarray:
+        """
+        Vectorized validate_product_data for many extractions at once
+        
+        Args:
+            product_names: Product names, one per extraction
+            confidences: Confidence scores
+            prices: Prices in LKR, NaN where no price was extracted
+            
+        Returns:
+            Boolean array, True where the extraction passes validation
+        """
+        confidences = np.asarray(confidences, dtype=np.float64)
+        prices = np.asarray(prices, dtype=np.float64)
+        
+        has_name = np.fromiter(
+            (bool(name and name.strip()) for name in product_names),
+            dtype=bool,
+            count=len(product_names)
+        )
+        price_ok = np.isnan(prices) | ((prices >= 1) & (prices <= 100000))
+        
+        return has_name & (confidences >= 0.3) & price_ok
+
+
+def start_cpu_pool() -> ProcessPoolExecutor:
+    """
+    Create the worker pool for the CPU stage
+    Workers are spawned rather than forked (forking after a threading runtime
+    such as OpenMP/TBB or gRPC has started leaves the children unusable) and
+    load the Numba kernels as they start
+    """
+    global _proc_pool
+    _proc_pool = ProcessPoolExecutor(
+        max_workers=os.cpu_count(),
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=warm_kernels
+    )
+    return _proc_pool
+
+
+def shutdown_cpu_pool():
+    """Stop the worker pool, dropping any queued work"""
+    global _proc_pool
+    if _proc_pool is not None:
+        _proc_pool.shutdown(wait=True, cancel_futures=True)
+        _proc_pool = None
+
+
+async def _run_cpu_stage(content: bytes) -> Tuple[bytes, float]:
+    """
+    Run cpu_stage in the worker pool
+    A crashed worker breaks the whole pool, so it is replaced for later uploads
+    """
+    pool = _proc_pool or start_cpu_pool()
+    try:
+        return await asyncio.get_running_loop().run_in_executor(pool, cpu_stage, content)
+    except BrokenProcessPool:
+        if _proc_pool is pool:
+            logger.error("CPU worker pool broke, starting a new one")
+            pool.shutdown(wait=False, cancel_futures=True)
+            start_cpu_pool()
+        raise
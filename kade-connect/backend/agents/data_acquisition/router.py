@@ -8,6 +8,8 @@ from fastapi.responses import JSONResponse
 from typing import Optional, List
 import os
 import uuid
+import asyncio
+import hashlib
 from pathlib import Path
 import aiofiles
 from datetime import datetime
@@ -15,8 +17,9 @@ import logging
 
 from backend.agents.data_acquisition.agent import DataAcquisitionAgent, ProcessingResult
 from backend.shared.config import settings
-from backend.shared.database import get_db
-from sqlalchemy.orm import Session
+from backend.shared.cache import redis_client
+from backend.shared.database import get_db, SessionFactory
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 logger = logging.getLogger(__name__)
 
@@ -25,16 +28,22 @@ router = APIRouter()
 # Initialize the agent
 data_agent = DataAcquisitionAgent()
 
+# Uploads are streamed to disk in chunks of this size
+UPLOAD_CHUNK_SIZE = 1 << 20  # 1MB
+
+# Extraction results are cached by upload content hash for this long
+EXTRACTION_CACHE_TTL = 86400  # 24 hours
+
 
 @router.post("/process-scout-image", response_model=ProcessingResult)
 async def process_scout_image(
     background_tasks: BackgroundTasks,
+    session_factory: SessionFactory,
     image: UploadFile = File(...),
     gps_latitude: Optional[float] = Form(None),
     gps_longitude: Optional[float] = Form(None),
     scout_id: Optional[str] = Form(None),
-    shop_name: Optional[str] = Form(None),
-    db: Session = Depends(get_db)
+    shop_name: Optional[str] = Form(None)
 ):
     """
     Process an image uploaded by a Kade Scout
@@ -57,14 +66,6 @@ async def process_scout_image(
                 detail="File must be an image"
             )
         
-        # Check file size
-        contents = await image.read()
-        if len(contents) > settings.MAX_FILE_SIZE:
-            raise HTTPException(
-                status_code=400,
-                detail=f"File size exceeds maximum limit of {settings.MAX_FILE_SIZE} bytes"
-            )
-        
         # Generate unique filename
         file_extension = Path(image.filename).suffix
         if file_extension.lower() not in settings.ALLOWED_EXTENSIONS:
@@ -79,17 +80,31 @@ async def process_scout_image(
         # Create directory if it doesn't exist
         file_path.parent.mkdir(parents=True, exist_ok=True)
         
-        # Save file
-        async with aiofiles.open(file_path, 'wb') as f:
-            await f.write(contents)
+        # Stream file to disk (enforces the size limit)
+        content_hash = await save_upload(image, file_path)
         
         logger.info(f"Saved scout image: {file_path}")
         
-        # Process image with the agent
         gps_coords = None
         if gps_latitude is not None and gps_longitude is not None:
             gps_coords = (gps_latitude, gps_longitude)
         
+        # Identical re-uploads reuse the earlier extraction but are still
+        # recorded, since the scout, location or shop may differ
+        cached = await get_cached_result(content_hash)
+        if cached:
+            logger.info(f"Using cached extraction for {content_hash}")
+            background_tasks.add_task(
+                save_processed_data,
+                cached.product_data,
+                str(file_path),
+                gps_coords,
+                scout_id,
+                session_factory
+            )
+            return cached
+        
+        # Process image with the agent
         metadata = {
             "scout_id": scout_id,
             "shop_name": shop_name,
@@ -105,13 +120,14 @@ async def process_scout_image(
         
         # Add background task to save to database if processing was successful
         if result.success and result.product_data:
+            await cache_result(content_hash, result)
             background_tasks.add_task(
                 save_processed_data,
                 result.product_data,
                 str(file_path),
                 gps_coords,
                 scout_id,
-                db
+                session_factory
             )
         
         return result
@@ -129,8 +145,7 @@ async def process_scout_image(
 @router.post("/batch-process")
 async def batch_process_images(
     images: List[UploadFile] = File(...),
-    scout_id: Optional[str] = Form(None),
-    db: Session = Depends(get_db)
+    scout_id: Optional[str] = Form(None)
 ):
     """
     Process multiple images in batch for bulk data collection
@@ -141,44 +156,64 @@ async def batch_process_images(
             detail="Maximum 10 images per batch"
         )
     
-    results = []
+    async def save_one(image: UploadFile):
+        # Generate unique filename
+        file_extension = Path(image.filename).suffix
+        unique_filename = f"{uuid.uuid4()}{file_extension}"
+        file_path = Path(settings.UPLOAD_DIR) / "scout_images" / "batch" / unique_filename
+        
+        # Create directory if it doesn't exist
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        # Stream file to disk (enforces the size limit)
+        content_hash = await save_upload(image, file_path)
+        
+        # Identical re-uploads reuse the earlier extraction
+        cached = await get_cached_result(content_hash)
+        return str(file_path), content_hash, cached
+    
+    outcomes = await asyncio.gather(
+        *[save_one(image) for image in images],
+        return_exceptions=True
+    )
+    
+    results: List[Optional[dict]] = [None] * len(images)
+    pending = []
     
-    for image in images:
-        try:
-            # Process each image (simplified version)
-            contents = await image.read()
-            
-            # Generate unique filename
-            file_extension = Path(image.filename).suffix
-            unique_filename = f"{uuid.uuid4()}{file_extension}"
-            file_path = Path(settings.UPLOAD_DIR) / "scout_images" / "batch" / unique_filename
-            
-            # Create directory if it doesn't exist
-            file_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            # Save file
-            async with aiofiles.open(file_path, 'wb') as f:
-                await f.write(contents)
-            
-            # Process image
-            result = await data_agent.process_image(str(file_path))
-            results.append({
+    for i, (image, outcome) in enumerate(zip(images, outcomes)):
+        if isinstance(outcome, Exception):
+            logger.error(f"Error processing {image.filename}: {outcome}")
+            results[i] = {
                 "filename": image.filename,
-                "result": result
-            })
-            
-        except Exception as e:
-            logger.error(f"Error processing {image.filename}: {e}")
-            results.append({
+                "error": str(outcome)
+            }
+            continue
+        
+        file_path, content_hash, cached = outcome
+        if cached:
+            results[i] = {
                 "filename": image.filename,
-                "error": str(e)
-            })
+                "result": cached
+            }
+        else:
+            pending.append((i, file_path, content_hash))
+    
+    # Process all remaining images together (single batched Vision API call)
+    if pending:
+        batch = await data_agent.process_images([path for _, path, _ in pending])
+        for (i, _, content_hash), result in zip(pending, batch):
+            if result.success and result.product_data:
+                await cache_result(content_hash, result)
+            results[i] = {
+                "filename": images[i].filename,
+                "result": result
+            }
     
     return {"batch_results": results}
 
 
 @router.get("/processing-stats")
-async def get_processing_stats(db: Session = Depends(get_db)):
+async def get_processing_stats(db: AsyncSession = Depends(get_db)):
     """
     Get statistics about image processing
     """
@@ -206,7 +241,7 @@ async def validate_extraction(
     image_id: str,
     is_correct: bool,
     corrected_data: Optional[dict] = None,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Allow scouts or admin to validate/correct AI extractions
@@ -242,12 +277,70 @@ async def validate_extraction(
         )
 
 
+async def save_upload(image: UploadFile, file_path: Path) -> str:
+    """
+    Stream an uploaded file to disk in fixed-size chunks
+    
+    Keeps peak memory at one chunk per request and rejects files larger than
+    MAX_FILE_SIZE without buffering them. Returns the blake2b hex digest of
+    the content.
+    """
+    size = 0
+    hasher = hashlib.blake2b()
+    
+    try:
+        async with aiofiles.open(file_path, 'wb') as f:
+            while chunk := await image.read(UPLOAD_CHUNK_SIZE):
+                size += len(chunk)
+                if size > settings.MAX_FILE_SIZE:
+                    raise HTTPException(
+                        status_code=400,
+                        detail=f"File size exceeds maximum limit of {settings.MAX_FILE_SIZE} bytes"
+                    )
+                hasher.update(chunk)
+                await f.write(chunk)
+    except Exception:
+        # Don't leave partial uploads behind
+        file_path.unlink(missing_ok=True)
+        raise
+    
+    return hasher.hexdigest()
+
+
+async def get_cached_result(content_hash: str) -> Optional[ProcessingResult]:
+    """
+    Look up a previous extraction for identical upload content
+    Cache errors are treated as a miss so Redis is never required
+    """
+    try:
+        cached = await redis_client.get(f"extract:{content_hash}")
+        if cached:
+            return ProcessingResult.model_validate_json(cached)
+    except Exception as e:
+        logger.warning(f"Extraction cache lookup failed: {e}")
+    return None
+
+
+async def cache_result(content_hash: str, result: ProcessingResult):
+    """
+    Store a successful extraction keyed by upload content hash
+    """
+    try:
+        await redis_client.set(
+            f"extract:{content_hash}",
+            result.model_dump_json(),
+            ex=EXTRACTION_CACHE_TTL
+        )
+    except Exception as e:
+        logger.warning(f"Extraction cache store failed: {e}")
+
+
 async def save_processed_data(
     product_data,
     image_path: str,
     gps_coords: Optional[tuple],
     scout_id: Optional[str],
-    db: Session
+    session_factory: async_sessionmaker[AsyncSession]
 ):
     """
     Background task to save processed data to database
@@ -256,12 +349,14 @@ async def save_processed_data(
         # This would save the extracted product data to the database
         # Along with the image path, GPS coordinates, and scout information
         logger.info(f"Saving processed data for product: {product_data.product_name}")
+        product_data.processing_timestamp = datetime.now()
         
         # Implementation would involve:
-        # 1. Creating database record for the extraction
-        # 2. Linking to scout and location
-        # 3. Updating inventory if product exists
-        # 4. Creating new product if doesn't exist
+        # 1. Opening a session from session_factory (the request's session is closed by now)
+        # 2. Creating database record for the extraction
+        # 3. Linking to scout and location
+        # 4. Updating inventory if product exists
+        # 5. Creating new product if doesn't exist
         
     except Exception as e:
         logger.error(f"Error saving processed data: {e}")
@@ -1,6 +1,9 @@
-from fastapi import APIRouter
+import orjson
+from fastapi import APIRouter, Response
 router = APIRouter()
 
+_HEALTH = orjson.dumps({"status": "healthy", "service": "execution-agent"})
+
 @router.get("/health")
 async def execution_health():
-    return {"status": "healthy", "service": "execution-agent"}
+    return Response(_HEALTH, media_type="application/json")
@@ -3,40 +3,59 @@ Kade Connect FastAPI Application
 Main application entry point with all routers and middleware
 """
 
-from fastapi import FastAPI, HTTPException, Depends
+from fastapi import FastAPI, Depends, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
+from fastapi.responses import JSONResponse
+from starlette.exceptions import HTTPException as StarletteHTTPException
+import asyncio
+import logging
+import orjson
 from contextlib import asynccontextmanager
 # import sentry_sdk
 # from sentry_sdk.integrations.fastapi import FastApiIntegration
 # from sentry_sdk.integrations.sqlalchemy import SqlalchemyIntegration
 
-from backend.shared.config import settings
-from backend.shared.database import init_db
+from backend.shared.config import settings, ensure_upload_dir
+from backend.shared.database import init_db, analyze_periodically
+from backend.shared.responses import ORJSONResponse
 from backend.services.auth.router import router as auth_router
 from backend.services.products.router import router as products_router
 from backend.services.inventory.router import router as inventory_router
 from backend.services.users.router import router as users_router
 from backend.services.orders.router import router as orders_router
 from backend.agents.data_acquisition.router import router as data_acquisition_router
+from backend.agents.data_acquisition.agent import start_cpu_pool, shutdown_cpu_pool
 from backend.agents.budget_optimization.router import router as budget_optimization_router
 from backend.agents.personalization.router import router as personalization_router
 from backend.agents.logistics.router import router as logistics_router
 from backend.agents.execution.router import router as execution_router
 
 
+logging.basicConfig(
+    level=settings.LOG_LEVEL,
+    format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan events"""
     # Startup
-    print("🚀 Starting Kade Connect API...")
+    logger.info("Starting Kade Connect API")
+    ensure_upload_dir()
     await init_db()
-    print("✅ Database initialized")
+    logger.info("Database initialized")
+    analyze_task = asyncio.create_task(analyze_periodically())
+    start_cpu_pool()
     
     yield
     
     # Shutdown
-    print("🔄 Shutting down Kade Connect API...")
+    logger.info("Shutting down Kade Connect API")
+    analyze_task.cancel()
+    shutdown_cpu_pool()
 
 
 # Initialize Sentry for error tracking (optional in development)
@@ -60,6 +79,7 @@ app = FastAPI(
     docs_url="/docs" if settings.DEBUG else None,
     redoc_url="/redoc" if settings.DEBUG else None,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     openapi_tags=[
         {
             "name": "Authentication",
@@ -102,15 +122,19 @@ app.add_middleware(
     allowed_hosts=settings.ALLOWED_HOSTS,
 )
 
-# Health check endpoint
+# Health check endpoint (body serialized once; probes hit it every few seconds).
+# A fresh Response is returned per call: FastAPI sets .background on the returned
+# object, so a shared module-level Response would be mutated across requests
+_HEALTH = orjson.dumps({
+    "status": "healthy",
+    "service": "kade-connect-api",
+    "version": "1.0.0"
+})
+
 @app.get("/health", tags=["Health"])
 async def health_check():
     """Health check endpoint for load balancers"""
-    return {
-        "status": "healthy",
-        "service": "kade-connect-api",
-        "version": "1.0.0"
-    }
+    return Response(_HEALTH, media_type="application/json")
 
 @app.get("/", tags=["Root"])
 async def root():
@@ -185,26 +209,35 @@ app.include_router(
 )
 
 # Exception handlers
-@app.exception_handler(404)
-async def not_found_handler(request, exc):
-    return HTTPException(
-        status_code=404,
-        detail="The requested resource was not found"
+@app.exception_handler(StarletteHTTPException)
+async def http_exception_handler(request, exc):
+    detail = exc.detail
+    if exc.status_code == 404 and detail == "Not Found":
+        # Unmatched route rather than a handler-raised 404
+        detail = "The requested resource was not found"
+    return JSONResponse(
+        status_code=exc.status_code,
+        content={"detail": detail},
+        headers=getattr(exc, "headers", None)
     )
 
-@app.exception_handler(500)
+@app.exception_handler(Exception)
 async def internal_error_handler(request, exc):
-    return HTTPException(
+    return JSONResponse(
         status_code=500,
-        detail="Internal server error occurred"
+        content={"detail": "Internal server error occurred"}
     )
 
 if __name__ == "__main__":
-    import uvicorn
-    uvicorn.run(
-        "main:app",
-        host="0.0.0.0",
-        port=8000,
-        reload=settings.DEBUG,
-        log_level=settings.LOG_LEVEL.lower(),
-    )
+    import runpy
+    import sys
+    # Start through uvicorn's own entry point rather than uvicorn.run(): spawned
+    # image-pipeline workers re-execute the parent's __main__ script, and this
+    # keeps them from rebuilding the whole app
+    sys.argv = [
+        "uvicorn", "main:app",
+        "--host", "0.0.0.0",
+        "--port", "8000",
+        "--log-level", settings.LOG_LEVEL.lower(),
+    ] + (["--reload"] if settings.DEBUG else [])
+    runpy.run_module("uvicorn", run_name="__main__", alter_sys=True)
@@ -1,20 +1,30 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, Text, ForeignKey
+from typing import Optional
+from sqlalchemy import String, Text, ForeignKey, Index, select, bindparam
+from sqlalchemy.orm import Mapped, mapped_column
 from backend.shared.database import Base
 
 class Product(Base):
     __tablename__ = "products"
-    id = Column(Integer, primary_key=True, index=True)
-    name = Column(String, nullable=False, index=True)
-    description = Column(Text)
-    category_id = Column(Integer, ForeignKey("categories.id"))
-    brand_id = Column(Integer, ForeignKey("brands.id"))
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    name: Mapped[str] = mapped_column(String, index=True)
+    description: Mapped[Optional[str]] = mapped_column(Text)
+    category_id: Mapped[Optional[int]] = mapped_column(ForeignKey("categories.id"))
+    brand_id: Mapped[Optional[int]] = mapped_column(ForeignKey("brands.id"), index=True)
+    # category_id needs no index of its own: it leads both composites below
+    __table_args__ = (
+        Index("ix_products_category_brand", "category_id", "brand_id", postgresql_include=["name"]),
+        Index("ix_products_category_name", "category_id", "name"),
+    )
 
 class Category(Base):
     __tablename__ = "categories"
-    id = Column(Integer, primary_key=True, index=True)
-    name = Column(String, nullable=False, unique=True)
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    name: Mapped[str] = mapped_column(String, unique=True)
 
 class Brand(Base):
     __tablename__ = "brands"
-    id = Column(Integer, primary_key=True, index=True)
-    name = Column(String, nullable=False, unique=True)
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    name: Mapped[str] = mapped_column(String, unique=True)
+
+# Point-select built once at import; executions reuse the engine's compiled form
+PRODUCT_BY_ID = select(Product).where(Product.id == bindparam("id"))
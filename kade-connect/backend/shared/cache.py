@@ -0,0 +1,14 @@
+"""
+Redis cache client
+"""
+
+import redis.asyncio as redis
+from backend.shared.config import settings
+
+# Shared async client; connections are opened lazily on first command.
+# Short timeouts so an unreachable Redis degrades to a cache miss quickly
+redis_client = redis.from_url(
+    settings.REDIS_URL,
+    socket_connect_timeout=0.2,
+    socket_timeout=0.5
+)
@@ -1,16 +1,21 @@
 """
 Application configuration and settings management
+Core settings load on first use; third-party secrets load only when one is read
 """
 
 from pydantic import BaseModel, field_validator
-from pydantic_settings import BaseSettings
-from typing import List, Optional
+from pydantic_settings import BaseSettings, SettingsConfigDict
+from typing import List, Optional, Tuple
+from functools import cache
 import os
+import logging
 from pathlib import Path
 
+logger = logging.getLogger(__name__)
 
-class Settings(BaseSettings):
-    """Application settings with validation"""
+
+class CoreSettings(BaseSettings):
+    """Application settings needed at boot, with validation"""
     
     # Application
     APP_NAME: str = "Kade Connect"
@@ -28,6 +33,10 @@ class Settings(BaseSettings):
     # Database
     DATABASE_URL: str = "sqlite:///./kade_connect_dev.db"
     DATABASE_ECHO: bool = False
+    DATABASE_POOL_SIZE: int = 20
+    DATABASE_MAX_OVERFLOW: int = 10
+    DATABASE_POOL_PRE_PING: bool = True
+    DATABASE_POOL_RECYCLE: int = 1800  # seconds
     
     # Redis
     REDIS_URL: str = "redis://localhost:6379"
@@ -37,52 +46,21 @@ class Settings(BaseSettings):
     CELERY_BROKER_URL: str = "redis://localhost:6379/0"
     CELERY_RESULT_BACKEND: str = "redis://localhost:6379/0"
     
-    # AI Service API Keys
-    OPENAI_API_KEY: Optional[str] = None
-    ANTHROPIC_API_KEY: Optional[str] = None
-    GOOGLE_VISION_API_KEY: Optional[str] = None
-    
-    # Supabase
-    SUPABASE_URL: Optional[str] = None
-    SUPABASE_ANON_KEY: Optional[str] = None
-    SUPABASE_SERVICE_KEY: Optional[str] = None
-    
-    # Google Services
-    GOOGLE_MAPS_API_KEY: Optional[str] = None
-    
-    # Payment Processing
-    STRIPE_PUBLIC_KEY: Optional[str] = None
-    STRIPE_SECRET_KEY: Optional[str] = None
-    STRIPE_WEBHOOK_SECRET: Optional[str] = None
-    
-    # AWS (Optional)
-    AWS_ACCESS_KEY_ID: Optional[str] = None
-    AWS_SECRET_ACCESS_KEY: Optional[str] = None
-    AWS_REGION: str = "ap-south-1"
-    AWS_S3_BUCKET: Optional[str] = None
-    
     # CORS
-    CORS_ORIGINS: List[str] = [
+    CORS_ORIGINS: Tuple[str, ...] = (
         "http://localhost:3000",
         "http://localhost:19006",
         "exp://localhost:19000",
-    ]
+    )
     
     # Trusted Hosts
-    ALLOWED_HOSTS: List[str] = ["*"]
+    ALLOWED_HOSTS: Tuple[str, ...] = ("*",)
     
     # File Upload
     MAX_FILE_SIZE: int = 50 * 1024 * 1024  # 50MB
     UPLOAD_DIR: str = "uploads"
     ALLOWED_EXTENSIONS: List[str] = [".jpg", ".jpeg", ".png", ".gif", ".webp"]
     
-    # External APIs
-    WEATHER_API_KEY: Optional[str] = None
-    SMS_API_KEY: Optional[str] = None
-    
-    # Monitoring
-    SENTRY_DSN: Optional[str] = None
-    
     # Rate Limiting
     RATE_LIMIT_PER_MINUTE: int = 60
     
@@ -90,14 +68,14 @@ class Settings(BaseSettings):
     @classmethod
     def assemble_cors_origins(cls, v):
         if isinstance(v, str):
-            return [i.strip() for i in v.split(",")]
+            return tuple(i.strip() for i in v.split(","))
         return v
     
     @field_validator("ALLOWED_HOSTS", mode="before")
     @classmethod
     def assemble_allowed_hosts(cls, v):
         if isinstance(v, str):
-            return [i.strip() for i in v.split(",")]
+            return tuple(i.strip() for i in v.split(","))
         return v
     
     @field_validator("SECRET_KEY")
@@ -118,30 +96,119 @@ class Settings(BaseSettings):
         """Create upload directory if it doesn't exist"""
         Path(self.UPLOAD_DIR).mkdir(parents=True, exist_ok=True)
     
-    class Config:
-        env_file = ".env"
-        case_sensitive = True
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        case_sensitive=True,
+        frozen=True,  # loaded once, never reassigned
+        extra="ignore",  # .env is shared with the other settings class
+    )
+
+
+class SecretSettings(BaseSettings):
+    """Third-party API keys and credentials, loaded on first access"""
+    
+    # AI Service API Keys
+    OPENAI_API_KEY: Optional[str] = None
+    ANTHROPIC_API_KEY: Optional[str] = None
+    GOOGLE_VISION_API_KEY: Optional[str] = None
+    
+    # Supabase
+    SUPABASE_URL: Optional[str] = None
+    SUPABASE_ANON_KEY: Optional[str] = None
+    SUPABASE_SERVICE_KEY: Optional[str] = None
+    
+    # Google Services
+    GOOGLE_MAPS_API_KEY: Optional[str] = None
+    
+    # Payment Processing
+    STRIPE_PUBLIC_KEY: Optional[str] = None
+    STRIPE_SECRET_KEY: Optional[str] = None
+    STRIPE_WEBHOOK_SECRET: Optional[str] = None
+    
+    # AWS (Optional)
+    AWS_ACCESS_KEY_ID: Optional[str] = None
+    AWS_SECRET_ACCESS_KEY: Optional[str] = None
+    AWS_REGION: str = "ap-south-1"
+    AWS_S3_BUCKET: Optional[str] = None
+    
+    # External APIs
+    WEATHER_API_KEY: Optional[str] = None
+    SMS_API_KEY: Optional[str] = None
+    
+    # Monitoring
+    SENTRY_DSN: Optional[str] = None
+    
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        case_sensitive=True,
+        frozen=True,  # loaded once, never reassigned
+        extra="ignore",  # .env is shared with the other settings class
+    )
+
+
+@cache
+def get_core_settings() -> CoreSettings:
+    """Load core settings once per process"""
+    return CoreSettings()
+
+
+@cache
+def get_secret_settings() -> SecretSettings:
+    """Load secret settings once per process, on first use"""
+    secrets = SecretSettings()
+    
+    # Validate required API keys in production
+    if get_core_settings().ENVIRONMENT == "production":
+        required_keys = [
+            "OPENAI_API_KEY",
+            "GOOGLE_VISION_API_KEY", 
+            "GOOGLE_MAPS_API_KEY"
+        ]
+        
+        missing_keys = []
+        for key in required_keys:
+            if not getattr(secrets, key):
+                missing_keys.append(key)
+        
+        if missing_keys:
+            logger.warning("Missing API keys in production: %s", ", ".join(missing_keys))
+            # Don't raise error, just warn
+    
+    return secrets
+
+
+class LazySettings:
+    """
+    Single settings object for the app
+    Each attribute is resolved from core or secret settings on first access,
+    then cached on the instance so later reads are plain attribute lookups.
+    Read-only, like the frozen settings it fronts
+    """
+    
+    def __getattr__(self, name):
+        if name in SecretSettings.model_fields:
+            value = getattr(get_secret_settings(), name)
+        else:
+            value = getattr(get_core_settings(), name)
+        object.__setattr__(self, name, value)
+        return value
+    
+    def __setattr__(self, name, value):
+        raise AttributeError(f"settings are read-only; cannot set {name!r}")
+    
+    def __delattr__(self, name):
+        raise AttributeError(f"settings are read-only; cannot delete {name!r}")
 
 
 # Create settings instance
-settings = Settings()
-
-# Create upload directory
-settings.create_upload_dir()
-
-# Validate required API keys in production
-if settings.ENVIRONMENT == "production":
-    required_keys = [
-        "OPENAI_API_KEY",
-        "GOOGLE_VISION_API_KEY", 
-        "GOOGLE_MAPS_API_KEY"
-    ]
-    
-    missing_keys = []
-    for key in required_keys:
-        if not getattr(settings, key):
-            missing_keys.append(key)
-    
-    if missing_keys:
-        print(f"⚠️ Warning: Missing API keys in production: {', '.join(missing_keys)}")
-        # Don't raise error, just warn
+settings = LazySettings()
+
+# Hot values as module globals
+DATABASE_URL = settings.DATABASE_URL
+SECRET_KEY = settings.SECRET_KEY
+
+
+@cache
+def ensure_upload_dir():
+    """Create the upload directory once per process (called at app startup)"""
+    settings.create_upload_dir()
@@ -2,35 +2,118 @@
 Database configuration and models
 """
 
-from sqlalchemy import create_engine, MetaData
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
-from backend.shared.config import settings
+import asyncio
+import logging
+from typing import Annotated, AsyncIterator
+from fastapi import Depends
+from sqlalchemy import create_engine, event, MetaData, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import DeclarativeBase, configure_mappers, sessionmaker
+from sqlalchemy.pool import QueuePool, StaticPool
+from backend.shared.config import settings, DATABASE_URL
+
+logger = logging.getLogger(__name__)
+
+# Connection pool tuning shared by the pooled engines
+POOL_OPTIONS = {
+    "pool_size": settings.DATABASE_POOL_SIZE,
+    "max_overflow": settings.DATABASE_MAX_OVERFLOW,
+    "pool_pre_ping": settings.DATABASE_POOL_PRE_PING,
+    "pool_recycle": settings.DATABASE_POOL_RECYCLE,
+}
+
+# Compiled-SQL cache entries per engine (SQLAlchemy default is 500); hot
+# statements are compiled once and reused across requests
+QUERY_CACHE_SIZE = 1200
+
+# Server-side prepared statements cached per asyncpg connection
+ASYNCPG_STATEMENT_CACHE_SIZE = 200
 
 # Create database engine
-if settings.DATABASE_URL.startswith("sqlite"):
-    # SQLite configuration for development
+if DATABASE_URL.startswith("sqlite") and ":memory:" in DATABASE_URL:
+    # In-memory SQLite must share a single connection
     engine = create_engine(
-        settings.DATABASE_URL,
+        DATABASE_URL,
         connect_args={"check_same_thread": False},
         poolclass=StaticPool,
         echo=settings.DATABASE_ECHO,
+        query_cache_size=QUERY_CACHE_SIZE,
+    )
+elif DATABASE_URL.startswith("sqlite"):
+    # File-backed SQLite for development; pooled so threads don't serialize on one connection
+    engine = create_engine(
+        DATABASE_URL,
+        connect_args={"check_same_thread": False},
+        poolclass=QueuePool,
+        echo=settings.DATABASE_ECHO,
+        query_cache_size=QUERY_CACHE_SIZE,
+        **POOL_OPTIONS,
     )
 else:
     # PostgreSQL configuration for production
     engine = create_engine(
-        settings.DATABASE_URL,
+        DATABASE_URL,
         echo=settings.DATABASE_ECHO,
-        pool_pre_ping=True,
-        pool_recycle=300,
+        query_cache_size=QUERY_CACHE_SIZE,
+        **POOL_OPTIONS,
     )
 
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-# Create base model class
-Base = declarative_base()
+
+def _async_database_url(url: str) -> str:
+    """Map the configured sync URL onto its async driver"""
+    if url.startswith("sqlite:///"):
+        return url.replace("sqlite:///", "sqlite+aiosqlite:///", 1)
+    return url.replace("postgresql://", "postgresql+asyncpg://", 1)
+
+
+# Async engine for request handlers, so session handling stays on the event loop
+if DATABASE_URL.startswith("sqlite"):
+    async_engine = create_async_engine(
+        _async_database_url(DATABASE_URL),
+        echo=settings.DATABASE_ECHO,
+        query_cache_size=QUERY_CACHE_SIZE,
+    )
+else:
+    async_engine = create_async_engine(
+        _async_database_url(DATABASE_URL),
+        echo=settings.DATABASE_ECHO,
+        query_cache_size=QUERY_CACHE_SIZE,
+        connect_args={"prepared_statement_cache_size": ASYNCPG_STATEMENT_CACHE_SIZE},
+        **POOL_OPTIONS,
+    )
+
+# SQLite tuning applied to every new connection: WAL so readers don't block
+# on writers, plus a larger page cache and memory-mapped I/O
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",  # 256MB
+    "PRAGMA cache_size=-65536",  # 64MB
+    "PRAGMA foreign_keys=ON",
+)
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    for pragma in SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
+
+if DATABASE_URL.startswith("sqlite"):
+    event.listen(engine, "connect", _set_sqlite_pragmas)
+    event.listen(async_engine.sync_engine, "connect", _set_sqlite_pragmas)
+
+# Create async session factory
+AsyncSessionLocal = async_sessionmaker(
+    async_engine,
+    autoflush=False,
+    expire_on_commit=False,
+)
 
 # Naming convention for constraints
 convention = {
@@ -41,30 +124,63 @@ convention = {
     "pk": "pk_%(table_name)s"
 }
 
-Base.metadata = MetaData(naming_convention=convention)
 
+# Create base model class (metadata set at class creation, never reassigned)
+class Base(DeclarativeBase):
+    metadata = MetaData(naming_convention=convention)
+
+
+# Register all models at import and configure mappers once at process start.
+# Modules (not names) are imported so this also works when a models module is
+# the first thing imported and is still initializing.
+from backend.services.auth import models as auth_models  # noqa: E402, F401
+from backend.services.products import models as product_models  # noqa: E402
+from backend.services.inventory import models as inventory_models  # noqa: E402, F401
+from backend.services.orders import models as order_models  # noqa: E402, F401
+
+configure_mappers()
 
-def get_db():
-    """Dependency to get database session"""
-    db = SessionLocal()
-    try:
+
+async def get_db() -> AsyncIterator[AsyncSession]:
+    """Dependency to get an async database session"""
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
+
+
+async def get_session_factory() -> async_sessionmaker[AsyncSession]:
+    """Dependency to get the session factory itself"""
+    return AsyncSessionLocal
+
+
+# For handlers that also do external I/O (Vision, LLM, HTTP): open a session
+# only around the DB work, so a pooled connection isn't held for the whole request:
+#     async with session_factory() as db: ...
+SessionFactory = Annotated[async_sessionmaker[AsyncSession], Depends(get_session_factory)]
 
 
 async def init_db():
     """Initialize database and create tables"""
-    # Import all models to ensure they are registered
-    from backend.services.auth.models import User
-    from backend.services.products.models import Product, Category, Brand
-    from backend.services.inventory.models import Inventory, PriceHistory, Vendor
-    from backend.services.orders.models import Order, OrderItem
-    
-    # Create all tables
+    # Create all tables (models are registered at module import)
     Base.metadata.create_all(bind=engine)
     
-    print("✅ Database initialized with SQLite")
+    # Give the query planner real statistics from the start
+    DatabaseManager.analyze()
+    
+    logger.info("Database initialized (%s)", engine.dialect.name)
+
+
+# Planner statistics are refreshed this often while the app runs
+ANALYZE_INTERVAL_SECONDS = 24 * 60 * 60
+
+
+async def analyze_periodically(interval: float = ANALYZE_INTERVAL_SECONDS):
+    """Background task re-gathering planner statistics (nightly by default)"""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await asyncio.to_thread(DatabaseManager.analyze)
+        except Exception as e:
+            logger.warning("ANALYZE failed: %s", e)
 
 
 class DatabaseManager:
@@ -75,6 +191,12 @@ class DatabaseManager:
         """Get a new database session"""
         return SessionLocal()
     
+    @staticmethod
+    async def get_product(db: AsyncSession, product_id: int):
+        """Fetch a product by id with the prebuilt point-select statement"""
+        result = await db.execute(product_models.PRODUCT_BY_ID, {"id": product_id})
+        return result.scalar_one_or_none()
+    
     @staticmethod
     def create_tables():
         """Create all database tables"""
@@ -85,6 +207,16 @@ class DatabaseManager:
         """Drop all database tables"""
         Base.metadata.drop_all(bind=engine)
     
+    @staticmethod
+    def analyze():
+        """Gather planner statistics (PRAGMA optimize on SQLite, ANALYZE on PostgreSQL)"""
+        with engine.begin() as conn:
+            if engine.dialect.name == "sqlite":
+                # 0x10002: analyze every table that needs it, not just recently queried ones
+                conn.execute(text("PRAGMA optimize=0x10002"))
+            else:
+                conn.execute(text("ANALYZE"))
+    
     @staticmethod
     def reset_database():
         """Reset database by dropping and recreating all tables"""
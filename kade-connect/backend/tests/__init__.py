@@ -0,0 +1 @@
+# Empty __init__.py to make tests a Python package
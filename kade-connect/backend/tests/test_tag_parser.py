@@ -0,0 +1,34 @@
+"""
+Tests for the Data Acquisition Agent's regex fast path on simple price tags
+"""
+
+from backend.agents.data_acquisition._tag_parser import parse_price_tag
+
+
+def test_weight_is_not_read_as_price():
+    assert parse_price_tag("Maliban Cream Crackers 190g Rs. 250") == (
+        "Maliban Cream Crackers 190g", "Maliban", 250.0
+    )
+
+
+def test_thousands_separator():
+    assert parse_price_tag("Anchor Milk Powder 400g LKR 1,150") == (
+        "Anchor Milk Powder 400g", "Anchor", 1150.0
+    )
+
+
+def test_four_digit_price_without_separator():
+    assert parse_price_tag("Anchor Milk Powder 400g Rs. 1150")[2] == 1150.0
+
+
+def test_four_digit_price_with_decimals():
+    assert parse_price_tag("Anchor Milk Powder 1kg Rs 2500.00")[2] == 2500.0
+
+
+def test_decimal_price():
+    _, brand, price = parse_price_tag("Kotmale Yoghurt 80g Rs.95.50")
+    assert (brand, price) == ("Kotmale", 95.5)
+
+
+def test_tag_without_price_falls_back_to_llm():
+    assert parse_price_tag("Maliban Cream Crackers 190g") is None
@@ -1,7 +1,8 @@
 """
 Simple FastAPI test application
 """
-from fastapi import FastAPI
+import orjson
+from fastapi import FastAPI, Response
 
 app = FastAPI(
     title="Kade Connect API - Test",
@@ -9,15 +10,29 @@ app = FastAPI(
     version="1.0.0"
 )
 
+# Static bodies serialized once at import
+_ROOT = orjson.dumps({"message": "Kade Connect API is running!", "status": "success"})
+_HEALTH = orjson.dumps({"status": "healthy", "service": "kade-connect-test"})
+
 @app.get("/")
 async def root():
-    return {"message": "Kade Connect API is running!", "status": "success"}
+    return Response(_ROOT, media_type="application/json")
 
 @app.get("/health")
 async def health():
-    return {"status": "healthy", "service": "kade-connect-test"}
+    return Response(_HEALTH, media_type="application/json")
 
 if __name__ == "__main__":
+    import os
+    import sys
     import uvicorn
     print("🚀 Starting Kade Connect API...")
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # uvloop + httptools (C event loop and HTTP parser); uvloop has no Windows build
+    uvicorn.run(
+        "test_app:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        workers=os.cpu_count(),
+    )
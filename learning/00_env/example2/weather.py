@@ -1,13 +1,31 @@
 import os
-import requests
-from dotenv import load_dotenv
+import asyncio
+import functools
+import logging
+import httpx
+import msgspec
+from dotenv import dotenv_values
+
+logger = logging.getLogger(__name__)
+
+if __name__ == "__main__":
+    # Configured before load_environment() runs below, so its message is shown
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+@functools.lru_cache(maxsize=4)
+def _read_env_file(env_file, mtime):
+    """Parse an env file once per (path, modification time)."""
+    return dotenv_values(env_file)
 
 def load_environment(env="development"):
     """Load the right .env file based on environment name."""
     env_file = f".env.{env}"
     if os.path.exists(env_file):
-        load_dotenv(env_file)
-        print(f"✅ Loaded {env_file}")
+        # Same semantics as load_dotenv(): existing variables win
+        for key, value in _read_env_file(env_file, os.path.getmtime(env_file)).items():
+            if value is not None:
+                os.environ.setdefault(key, value)
+        logger.info("Loaded %s", env_file)
     else:
         raise FileNotFoundError(f"{env_file} not found!")
 
@@ -18,19 +36,64 @@ load_environment(current_env)
 API_KEY = os.getenv("WEATHER_API_KEY")
 BASE_URL = "https://api.openweathermap.org/data/2.5/weather"
 
-def get_weather(city):
+class Main(msgspec.Struct):
+    temp: float
+
+class Weather(msgspec.Struct):
+    description: str
+
+class WeatherResponse(msgspec.Struct):
+    """Only the fields we use; msgspec skips the rest while decoding."""
+    name: str
+    main: Main
+    weather: list[Weather]
+
+def new_client():
+    """HTTP/2 client: concurrent requests share one TLS connection."""
+    return httpx.AsyncClient(
+        timeout=10.0,
+        transport=httpx.AsyncHTTPTransport(
+            http2=True,
+            retries=3,
+            limits=httpx.Limits(max_keepalive_connections=20),
+        ),
+    )
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+async def _get(client, url, **kwargs):
+    """GET with up to 3 retries on 429/5xx (transport retries only cover connect errors)."""
+    for attempt in range(3):
+        response = await client.get(url, **kwargs)
+        if response.status_code not in RETRY_STATUSES:
+            return response
+        await asyncio.sleep(0.3 * 2 ** attempt)
+    return await client.get(url, **kwargs)
+
+async def get_weather(city, client):
     params = {"q": city, "appid": API_KEY, "units": "metric"}
-    response = requests.get(BASE_URL, params=params)
-    data = response.json()
+    response = await _get(client, BASE_URL, params=params)
 
     if response.status_code == 200:
-        print(f"\n🌍 City: {data['name']}")
-        print(f"🌡️ Temp: {data['main']['temp']}°C")
-        print(f"☁️ Weather: {data['weather'][0]['description']}")
+        data = msgspec.json.decode(response.content, type=WeatherResponse)
+        print(f"\n🌍 City: {data.name}")
+        print(f"🌡️ Temp: {data.main.temp}°C")
+        print(f"☁️ Weather: {data.weather[0].description}")
         print(f"🔧 Debug mode: {os.getenv('DEBUG')}")
     else:
+        data = msgspec.json.decode(response.content)
         print("Error:", data.get("message", "Something went wrong"))
 
+async def get_weather_many(cities):
+    """Query several cities concurrently over one client."""
+    async with new_client() as client:
+        await asyncio.gather(*(get_weather(city, client) for city in cities))
+
+async def main(city):
+    """Single lookup from the command line."""
+    async with new_client() as client:
+        await get_weather(city, client)
+
 if __name__ == "__main__":
     city = input("Enter city: ")
-    get_weather(city)
+    asyncio.run(main(city))
@@ -1,32 +1,76 @@
 import os
-import requests
+import asyncio
+import httpx
+import msgspec
 from dotenv import load_dotenv
 
 #load env
 load_dotenv()
 
 API_KEY = os.getenv("WEATHER_API_KEY")
-BASE_URL = "http://api.openweathermap.org/data/2.5/weather"
+BASE_URL = "https://api.openweathermap.org/data/2.5/weather"
 
-def get_weather(city):
-    
+#only the fields we use, msgspec skips the rest
+class Main(msgspec.Struct):
+    temp: float
+
+class Weather(msgspec.Struct):
+    description: str
+
+class WeatherResponse(msgspec.Struct):
+    name: str
+    main: Main
+    weather: list[Weather]
+
+#http/2 client, many requests share one connection
+def new_client():
+    return httpx.AsyncClient(
+        timeout=10.0,
+        transport=httpx.AsyncHTTPTransport(
+            http2=True,
+            retries=3,
+            limits=httpx.Limits(max_keepalive_connections=20),
+        ),
+    )
+
+#transport retries only cover connection errors, so retry 429/5xx here
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+async def _get(client, url, **kwargs):
+    for attempt in range(3):
+        response = await client.get(url, **kwargs)
+        if response.status_code not in RETRY_STATUSES:
+            return response
+        await asyncio.sleep(0.3 * 2 ** attempt)
+    return await client.get(url, **kwargs)
+
+async def get_weather(city, client):
     params = {
         "q":city,
         "appid":API_KEY,
         "units":"metric"
     }
     
-    response = requests.get(BASE_URL, params=params)
-    
-    data = response.json()
+    response = await _get(client, BASE_URL, params=params)
     
     if response.status_code == 200:
-        print(f"🌍 City: {data['name']}")
-        print(f"🌡️ Temp: {data['main']['temp']}°C")
-        print(f"☁️ Weather: {data['weather'][0]['description']}")
+        data = msgspec.json.decode(response.content, type=WeatherResponse)
+        print(f"🌍 City: {data.name}")
+        print(f"🌡️ Temp: {data.main.temp}°C")
+        print(f"☁️ Weather: {data.weather[0].description}")
     else:
+        data = msgspec.json.decode(response.content)
         print("Error:", data.get("message", "Something went wrong"))
+
+#query several cities at once
+async def get_weather_many(cities):
+    async with new_client() as client:
+        await asyncio.gather(*(get_weather(city, client) for city in cities))
+
+async def main(city):
+    async with new_client() as client:
+        await get_weather(city, client)
         
 if __name__ == "__main__":
     city = input("Enter city: ")
-    get_weather(city)
\ No newline at end of file
+    asyncio.run(main(city))
@@ -1,10 +1,21 @@
-import requests
+import asyncio
+import httpx
+from cachetools import TTLCache
 
-def get_weather(city="London"):
-    url = f"https://wttr.in/{city}?format=3"
-    
-    return requests.get(url).text
+# city -> report; weather changes slowly, so repeat lookups skip the HTTP call
+_cache = TTLCache(maxsize=1024, ttl=300)
+
+async def get_weather(client, city="London"):
+    if city not in _cache:
+        response = await client.get(f"https://wttr.in/{city}?format=3")
+        response.raise_for_status()
+        _cache[city] = response.text
+    return _cache[city]
+
+async def main(city):
+    async with httpx.AsyncClient(timeout=10.0) as client:
+        return await get_weather(client, city)
 
 if __name__ == "__main__":
     city = input("Enter city: ")
-    print(get_weather(city))
\ No newline at end of file
+    print(asyncio.run(main(city)))